@@ -31,19 +31,22 @@ class JobMatchingAIService:
             Dictionary with various similarity scores
         """
         try:
-            user_embedding = self.embedding_service.encode_skills(user_skills)
-            job_embedding = self.embedding_service.encode_skills(job_skills)
-            skills_similarity = self.embedding_service.calculate_similarity(
-                user_embedding, job_embedding
-            )
-
-            # Description-based similarity (if available)
-            desc_similarity = 0.0
-            if job_description:
-                desc_embedding = self.embedding_service.encode_text(job_description)
-                desc_similarity = self.embedding_service.calculate_similarity(
-                    user_embedding, desc_embedding
-                )
+            skills_similarity = desc_similarity = 0.0
+
+            # Without user skills every similarity is zero, so skip the job encodes
+            if user_skills:
+                user_embedding = self.embedding_service.encode_skills(user_skills)
+                candidates = [self.embedding_service.encode_skills(job_skills)]
+
+                # Description-based similarity (if available)
+                if job_description:
+                    candidates.append(self.embedding_service.encode_text(job_description))
+
+                # Score skills and description against the user in a single pass
+                similarities = self.embedding_service.calculate_similarities(user_embedding, candidates)
+                skills_similarity = similarities[0]
+                if job_description:
+                    desc_similarity = similarities[1]
 
             # Calculate skill coverage
             skill_coverage = self._calculate_skill_coverage(user_skills, job_skills)
@@ -1,5 +1,11 @@
+import hashlib
 import logging
-from typing import List, Dict, Any
+import re
+import threading
+from itertools import chain
+from typing import List, Dict, Any, Tuple
+
+from cachetools import LRUCache
 
 from utils.common import clean_text
 from rag.generation.llm_service import llm_service
@@ -26,6 +32,27 @@ class SkillExtractionService:
             'project management', 'agile', 'scrum', 'analytical thinking'
         ]
 
+        # Every keyword (plus the unspaced form of multi-word soft skills) mapped to
+        # (is_technical, display name), matched by one compiled alternation. Longest
+        # keywords come first so e.g. "javascript" wins over "java" at the same spot,
+        # and the lookarounds only accept whole words ("go" no longer hits "google").
+        # \b is not used because it fails after keywords ending in a symbol (c++, c#).
+        self._keyword_lookup = {}
+        for keywords in self.technical_keywords.values():
+            for keyword in keywords:
+                self._keyword_lookup[keyword] = (True, keyword.title())
+        for skill in self.soft_skills:
+            self._keyword_lookup.setdefault(skill, (False, skill.title()))
+            self._keyword_lookup.setdefault(skill.replace(' ', ''), (False, skill.title()))
+
+        self._keyword_pattern = re.compile(r'(?<!\w)(?:' + '|'.join(
+            re.escape(keyword) for keyword in sorted(self._keyword_lookup, key=len, reverse=True)
+        ) + r')(?!\w)')
+
+        # Scraped postings are re-processed on every crawl; remember results by content digest
+        self._pattern_cache = LRUCache(maxsize=1024)
+        self._pattern_cache_lock = threading.Lock()
+
     async def extract_skills_from_job(self, job_description: str, job_title: str = "") -> Dict[str, Any]:
         """
         Extract skills from job description using multiple methods.
@@ -59,26 +86,38 @@ class SkillExtractionService:
     def _extract_skills_pattern(self, text: str) -> Dict[str, Any]:
         """Extract skills using pattern matching."""
         text_lower = clean_text(text).lower()
-        technical_skills = []
-        soft_skills = []
+        cache_key = hashlib.blake2b(text_lower.encode(), digest_size=16).digest()
 
-        # Extract technical skills
-        for category, keywords in self.technical_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    technical_skills.append(keyword.title())
-
-        # Extract soft skills
-        for skill in self.soft_skills:
-            if skill.replace(' ', '') in text_lower or skill in text_lower:
-                soft_skills.append(skill.title())
+        with self._pattern_cache_lock:
+            cached = self._pattern_cache.get(cache_key)
+        if cached is None:
+            cached = self._scan_skills(text_lower)
+            with self._pattern_cache_lock:
+                self._pattern_cache[cache_key] = cached
 
+        technical_skills, soft_skills = cached
         return {
-            "technical": list(set(technical_skills)),
-            "soft": list(set(soft_skills)),
+            "technical": list(technical_skills),
+            "soft": list(soft_skills),
             "confidence": 0.7
         }
 
+    def _scan_skills(self, text_lower: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Find technical and soft skills in already cleaned, lower-cased text."""
+        # Dicts as ordered sets: duplicates collapse on insert, first-seen order is kept
+        technical_skills = {}
+        soft_skills = {}
+
+        # Single left-to-right scan over the text for all keywords
+        for match in self._keyword_pattern.finditer(text_lower):
+            is_technical, skill = self._keyword_lookup[match.group()]
+            if is_technical:
+                technical_skills[skill] = None
+            else:
+                soft_skills[skill] = None
+
+        return tuple(technical_skills), tuple(soft_skills)
+
     async def _extract_skills_llm(self, job_description: str, job_title: str = "") -> Dict[str, Any]:
         """Extract skills using LLM for more accurate results."""
         try:
@@ -108,12 +147,12 @@ class SkillExtractionService:
 
     def _combine_skill_results(self, pattern_result: Dict, llm_result: Dict) -> Dict[str, Any]:
         """Combine results from different extraction methods."""
-        combined_technical = list(set(
-            pattern_result.get("technical", []) + llm_result.get("technical", [])
+        combined_technical = list(dict.fromkeys(
+            chain(pattern_result.get("technical", []), llm_result.get("technical", []))
         ))
 
-        combined_soft = list(set(
-            pattern_result.get("soft", []) + llm_result.get("soft", [])
+        combined_soft = list(dict.fromkeys(
+            chain(pattern_result.get("soft", []), llm_result.get("soft", []))
         ))
 
         # Use pattern matching confidence as base, boost if LLM agrees
@@ -129,13 +168,13 @@ class SkillExtractionService:
 
     def validate_skill_list(self, skills: List[str]) -> List[str]:
         """Validate and clean a list of skills."""
-        validated = []
+        validated = {}
         for skill in skills:
             if isinstance(skill, str) and skill.strip():
                 cleaned = clean_text(skill)
                 if len(cleaned) >= 2 and len(cleaned) <= 50:  # Reasonable length limits
-                    validated.append(cleaned)
+                    validated[cleaned] = None  # Remove duplicates, keep order
 
-        return list(set(validated))  # Remove duplicates
+        return list(validated)
 
 skill_extraction_service = SkillExtractionService()
\ No newline at end of file
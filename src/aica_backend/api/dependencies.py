@@ -1,75 +1,82 @@
 from fastapi import HTTPException, status, Request
-from fastapi.security.utils import get_authorization_scheme_param
-from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from typing import Optional, Dict, Any
 import logging
 
 from ..database.session import SessionLocal
 from ..database import models
-from ..database.repositories.user import UserCRUD
+from ..database.repositories.user import UserCRUD, AuthUser
 from ..core.security import token_manager
 
 logger = logging.getLogger(__name__)
 
+_UNSET = object()
+BEARER_PREFIX = b"bearer "
+
 def get_db():
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
         
 def extract_token_from_request(request: Request) -> Optional[str]:
+    # Memoized on request.state so middleware and dependencies parse the token once
+    cached = getattr(request.state, '_auth_token', _UNSET)
+    if cached is not _UNSET:
+        return cached
+
+    token = _read_token(request)
+    request.state._auth_token = token
+    return token
+
+def _read_token(request: Request) -> Optional[str]:
     cookie_token = request.cookies.get("access_token")
     if cookie_token:
         if cookie_token.startswith("Bearer "):
             return cookie_token[7:]
         return cookie_token
     
-    authorization = request.headers.get("Authorization")
-    if authorization:
-        scheme, token = get_authorization_scheme_param(authorization)
-        if scheme.lower() == "bearer":
-            return token
+    # Scan the raw ASGI headers; names are already lowercased bytes
+    for name, value in request.scope["headers"]:
+        if name == b"authorization":
+            if value[:7].lower() == BEARER_PREFIX:
+                return value[7:].decode("latin-1")
+            return None
     return None
-    
-def get_current_user(request: Request) -> models.User:
-    logger.info(f"get_current_user called for path: {request.url.path}")
-    
-    # Middleware-provided user
-    if getattr(request.state, 'is_authenticated', False) and hasattr(request.state, 'user'):
-        user = getattr(request.state, 'user', None)
-        if user:
-            logger.info(f"User found in middleware state: {user.email}")
-            return user
+
+def verify_request_token(request: Request) -> Optional[Dict[str, Any]]:
+    cached = getattr(request.state, '_auth_payload', _UNSET)
+    if cached is not _UNSET:
+        return cached
+
     token = extract_token_from_request(request)
-    logger.info(f"Token extracted: {'Present' if token else 'Missing'}")
+    payload = token_manager.verify_token(token, token_type="access") if token else None
+    request.state._auth_payload = payload
+    return payload
     
-    if not token:
-        logger.warning("No authentication token found")
+async def get_current_identity(request: Request) -> AuthUser:
+    """Identity resolved by AuthMiddleware; no threadpool hop and no database query."""
+    auth_user = getattr(request.state, 'user', None)
+    if not auth_user:
+        logger.warning("No authenticated identity on the request")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated", headers={'WWW-Authenticate': 'Bearer'})
     
-    payload = token_manager.verify_token(token, token_type="access")
-    logger.info(f"Token verification result: {'Valid' if payload else 'Invalid'}")
-    
-    if not payload:
-        logger.warning("Token verification failed")
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token", headers={'WWW-Authenticate': 'Bearer'})
-    
-    email = payload.get("sub")
-    if not email:
-        logger.warning("No email found in token payload")
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload", headers={'WWW-Authenticate': 'Bearer'})
+    return auth_user
+
+async def get_current_user(request: Request) -> models.User:
+    logger.info("get_current_user called for path: %s", request.scope["path"])
     
+    # Only routes that need the full row pay for the lookup
+    auth_user = await get_current_identity(request)
+    logger.info("User found in middleware state: %s", auth_user.email)
+    return await run_in_threadpool(_load_user_by_id, auth_user.id)
+
+def _load_user_by_id(user_id: int) -> models.User:
     with SessionLocal() as db:
-        user = UserCRUD.get_user_by_email(db, email=email)
+        user = UserCRUD.get_user_by_id(db, user_id)
         if not user:
-            logger.warning(f"User not found in database: {email}")
+            logger.warning("User not found in database: %s", user_id)
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found", headers={'WWW-Authenticate': 'Bearer'})
         
-        logger.info(f"User successfully authenticated: {user.email}")
         return user
 
-def get_optional_current_user(request: Request) -> Optional[models.User]:
-    if getattr(request.state, 'is_authenticated', False) and hasattr(request.state, 'user'):
-        return request.state.user
-    
-    return None
+async def get_optional_current_user(request: Request) -> Optional[AuthUser]:
+    return getattr(request.state, 'user', None)
@@ -1,5 +1,9 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware as FastAPICORSMiddleware
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from ..core.rate_limiter import limiter
 from .middleware.cors import CORSConfig
 from .middleware.security_headers import SecurityHeadersMiddleware
 from .middleware.auth import AuthMiddleware
@@ -10,10 +14,14 @@ app = FastAPI(
     description="API for AICA application", 
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 cors_config = CORSConfig().get_config()
 
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
 app.add_middleware(FastAPICORSMiddleware, **cors_config)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(AuthMiddleware)
@@ -24,15 +32,6 @@ app.include_router(profiles.router, prefix="/api/v1", tags=["profile"])
 app.include_router(matching.router, prefix="/api/v1/matching", tags=["matching"])
 app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["jobs"])
 
-# Add profile completion status endpoint
-from .v1.routes.profiles import get_profile_completion_status
-app.add_api_route(
-    "/api/v1/profile/completion-status",
-    get_profile_completion_status,
-    methods=["GET"],
-    tags=["profile"]
-)
-
 @app.get("/")
 async def root():
     return {"message": "AICA API is running"}
@@ -1,21 +1,19 @@
 import logging
-from typing import Optional, Set
+from typing import FrozenSet, Optional, Tuple
 from fastapi import Request
 
-from ..dependencies import extract_token_from_request
-from ...database import models
-from ...core.config import settings
-from ...database.repositories.user import UserCRUD
-from ...database.session import SessionLocal
-from jose import jwt, JWTError
+from ..dependencies import extract_token_from_request, verify_request_token
+from ...database.repositories.user import AuthUser
 
 logger = logging.getLogger(__name__)
 
 class AuthMiddleware:
-    PUBLIC_PATHS: Set[str] = {
-        "/docs", "/redoc", "/openapi.json", "/health", "/",
-        "/api/v1/login/access-token", "/api/v1/refresh", "/api/v1/logout"
-    }
+    """Resolve the caller's identity once per request from the verified token claims."""
+    # Only API routes are authenticated; docs, health and unmatched paths pass straight through
+    API_PREFIX = "/api/"
+    # Exact matches are a single hash lookup; only the prefixes need startswith
+    PUBLIC_PATHS: FrozenSet[str] = frozenset({"/api/v1/users/"})
+    PUBLIC_PREFIXES: Tuple[str, ...] = ("/api/v1/login/access-token", "/api/v1/refresh")
     
     def __init__(self, app):
         self.app = app
@@ -29,45 +27,41 @@ class AuthMiddleware:
             await self.app(scope, receive, send)
             return
 
-        request = Request(scope)
-
-        if self._is_public_path(request.url.path):
+        # Decide on the raw path before building a Request for the fast path
+        if self._is_public_path(scope["path"]):
             await self.app(scope, receive, send)
             return
         
+        request = Request(scope)
         token = self._extract_token(request)
-        user = await self._validate_token(token) if token else None
+        user = self._resolve_identity(request) if token else None
         
-        scope['state'] = {'is_authenticated': user is not None, 'user': user}
+        # Update rather than replace the state so the memoized token and payload survive
+        scope.setdefault('state', {})['user'] = user
         
         await self.app(scope, receive, send)
 
     def _is_public_path(self, path: str) -> bool:
-        if path == "/api/v1/users/":
-            return True
-        return any(path.startswith(public_path) for public_path in self.PUBLIC_PATHS)
+        return (
+            not path.startswith(self.API_PREFIX)
+            or path in self.PUBLIC_PATHS
+            or path.startswith(self.PUBLIC_PREFIXES)
+        )
     
     def _extract_token(self, request: Request) -> Optional[str]:
         return extract_token_from_request(request)
     
-    async def _validate_token(self, token: str) -> Optional[models.User]:
-        if not token:
-            logger.warning("No token provided for validation")
+    def _resolve_identity(self, request: Request) -> Optional[AuthUser]:
+        # Verification is an HS256 check behind TokenManager's cache, so it stays inline;
+        # the identity comes from the signed claims and needs no database lookup
+        logger.info("Validating token in middleware")
+        payload = verify_request_token(request)
+        if not payload:
+            logger.warning("Token validation failed in middleware")
+            return None
+        email = payload.get("sub")
+        user_id = payload.get("user_id")
+        if not email or not isinstance(user_id, int):
+            logger.warning("Token payload is missing the user identity")
             return None
-        try:
-            logger.info(f"Validating token in middleware")
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            email: str = payload.get("sub")
-            if not email:
-                logger.warning("No email found in token payload")
-                return None
-            with SessionLocal() as db:
-                user = UserCRUD.get_user_by_email(db, email=email)
-                if user:
-                    logger.info(f"User validated in middleware: {user.email}")
-                else:
-                    logger.warning(f"User not found in database: {email}")
-                return user
-        except JWTError as e:
-            logger.error(f"JWT validation error in middleware: {str(e)}")
-            return None
\ No newline at end of file
+        return AuthUser(id=user_id, email=email)
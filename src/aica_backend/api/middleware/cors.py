@@ -1,67 +1,82 @@
 from ...core.config import settings
 
+ALLOWED_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH")
+
+ALLOWED_HEADERS = (
+    "Accept",
+    "Accept-Language",
+    "Content-Language",
+    "Content-Type",
+    "Authorization",
+    "X-Requested-With",
+    "X-CSRF-Token",
+    "Cookie",
+    "Set-Cookie",
+)
+
+EXPOSED_HEADERS = (
+    "Content-Type",
+    "Authorization",
+    "X-Total-Count",
+    "X-Page-Count",
+    "Set-Cookie",
+)
+
+DEV_ALLOWED_ORIGINS = (
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:3001",
+)
+
+LOCALHOST_ORIGIN_PREFIXES = (b"http://localhost:", b"http://127.0.0.1:")
+
+
+def _get_header(scope, name: bytes) -> bytes:
+    """Return the first value of a lowercase header name straight from the ASGI list."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return b""
+
+
 class CORSConfig:
-    def get_config(self):
-        return {
+    def __init__(self):
+        # Settings are fixed after startup, so the config is built once
+        self._config = {
             "allow_origins": self._get_allowed_origins(),
             "allow_credentials": True,
-            "allow_methods": self._get_allowed_methods(),
-            "allow_headers": self._get_allowed_headers(),
-            "expose_headers": self._get_exposed_headers(),
+            "allow_methods": ALLOWED_METHODS,
+            "allow_headers": ALLOWED_HEADERS,
+            "expose_headers": EXPOSED_HEADERS,
             "max_age": 86400,
         }
 
+    def get_config(self):
+        return self._config
+
     def _get_allowed_origins(self):
         """Define allowed origins for CORS based on environment"""
         if settings.ENVIRONMENT == "production":
-            return settings.ALLOWED_ORIGINS
+            return tuple(settings.ALLOWED_ORIGINS)
         else:
-            return list(set([
-                "http://localhost:3000",
-                "http://localhost:3001",
-                "http://127.0.0.1:3000",
-                "http://127.0.0.1:3001",
-            ]))
-
-    def _get_allowed_methods(self):
-        return ["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"]
-
-    def _get_allowed_headers(self):
-        return [
-            "Accept",
-            "Accept-Language",
-            "Content-Language",
-            "Content-Type",
-            "Authorization",
-            "X-Requested-With",
-            "X-CSRF-Token",
-            "Cookie",
-            "Set-Cookie",
-        ]
-
-    def _get_exposed_headers(self):
-        return [
-            "Content-Type",
-            "Authorization",
-            "X-Total-Count",
-            "X-Page-Count",
-            "Set-Cookie",
-        ]
+            return DEV_ALLOWED_ORIGINS
 
 
 class OriginValidationMiddleware:
     """Additional origin validation middleware"""
     def __init__(self, app):
         self.app = app
-        self.allowed_origins = settings.ALLOWED_ORIGINS
+        # Raw header bytes are compared directly, so no per-request decode
+        self.allowed_origins = frozenset(origin.encode("latin-1") for origin in settings.ALLOWED_ORIGINS)
 
     async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
-            headers = dict(scope["headers"])
-            origin = headers.get(b"origin", b"").decode()
+        # Preflights are left to the CORS middleware
+        if scope["type"] == "http" and scope["method"] != "OPTIONS":
+            origin = _get_header(scope, b"origin")
 
             if settings.ENVIRONMENT == "development":
-                if origin.startswith(("http://localhost:", "http://127.0.0.1:")):
+                if origin.startswith(LOCALHOST_ORIGIN_PREFIXES):
                     pass  # Allow localhost origins in dev
             elif origin not in self.allowed_origins:
                 response = {
@@ -1,16 +1,34 @@
 from typing import Dict
 import logging
+import re
 
 
 from ...core.config import settings
 
 logger = logging.getLogger(__name__)
 
+SUSPICIOUS_PATTERNS = [
+    "<script", "javascript:", "vbscript:", "onload=", "onerror=",
+    "eval(", "expression(", "url(", "import(", "__import__",
+    "SELECT * FROM", "DROP TABLE", "INSERT INTO", "DELETE FROM",
+    "../", "..\\", "/etc/passwd", "/etc/shadow", "cmd.exe", "powershell"
+]
+# One case-insensitive alternation of the literals, scanned in a single pass
+SUSPICIOUS_CONTENT_PATTERN = re.compile(
+    "|".join(re.escape(pattern) for pattern in SUSPICIOUS_PATTERNS), re.IGNORECASE
+)
+
 class SecurityHeadersMiddleware:
     
     def __init__(self, app):
         self.app = app
         self.security_headers = self._get_security_headers()
+        # Encoded once; replace any same-named header the response already set
+        self._raw_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in self.security_headers.items()
+        ]
+        self._raw_header_names = frozenset(name for name, _ in self._raw_headers)
     
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
@@ -19,10 +37,13 @@ class SecurityHeadersMiddleware:
 
         async def send_wrapper(message):
             if message["type"] == "http.response.start":
-                headers = dict(message.get("headers", []))
-                for header_name, header_value in self.security_headers.items():
-                    headers[header_name.encode()] = header_value.encode()
-                message["headers"] = list(headers.items())
+                message["headers"] = [
+                    *(
+                        (name, value) for name, value in message.get("headers", ())
+                        if name.lower() not in self._raw_header_names
+                    ),
+                    *self._raw_headers,
+                ]
             await send(message)
 
         await self.app(scope, receive, send_wrapper)
@@ -88,15 +109,11 @@ class SecurityHeadersMiddleware:
 class RequestSanitizationMiddleware:
     def __init__(self, app):
         self.app = app
-        self.suspicious_patterns = [
-            "<script", "javascript:", "vbscript:", "onload=", "onerror=",
-            "eval(", "expression(", "url(", "import(", "__import__",
-            "SELECT * FROM", "DROP TABLE", "INSERT INTO", "DELETE FROM",
-            "../", "..\\", "/etc/passwd", "/etc/shadow", "cmd.exe", "powershell"
-        ]
+        self.suspicious_patterns = SUSPICIOUS_PATTERNS
     
     async def __call__(self, scope, receive, send):
-        if scope["type"] != "http":
+        # Preflights carry no payload worth scanning; CORS answers them
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
             await self.app(scope, receive, send)
             return
 
@@ -118,5 +135,4 @@ class RequestSanitizationMiddleware:
         await self.app(scope, receive, send)
     
     def _contains_suspicious_content(self, content: str) -> bool:
-        content_lower = content.lower()
-        return any(pattern.lower() in content_lower for pattern in self.suspicious_patterns)
\ No newline at end of file
+        return SUSPICIOUS_CONTENT_PATTERN.search(content) is not None
\ No newline at end of file
@@ -1,10 +1,13 @@
+import secrets
+
 from fastapi import APIRouter, Depends, HTTPException, status, Request,Response
 from fastapi.security import OAuth2PasswordRequestForm
+from typing import Union
 from sqlalchemy.orm import Session
 
-from ....database.repositories.user import UserCRUD
-from ....core.security import verify_password, token_manager, security_validator
-from ....core.rate_limiter import rate_limiter
+from ....database.repositories.user import UserCRUD, AuthUser
+from ....core.security import verify_password, pwd_context, token_manager, security_validator
+from ....core.rate_limiter import rate_limiter, limiter
 from ....core.config import settings
 from .. import schemas
 from ... import dependencies
@@ -12,6 +15,10 @@ from ....database import models
 
 router = APIRouter()
 
+# Checked when the email is unknown so every login attempt costs one bcrypt verify.
+# Hashed via pwd_context directly: it is not a user password, so no strength policy.
+DUMMY_PASSWORD_HASH = pwd_context.hash(secrets.token_urlsafe(32))
+
 def _handle_failed_login(identifier: str, detail: str = "Invalid email or password"):
     rate_limiter.record_failed_attempt(identifier)
     raise HTTPException(
@@ -20,7 +27,7 @@ def _handle_failed_login(identifier: str, detail: str = "Invalid email or passwo
         headers={"WWW-Authenticate": "Bearer"}
     )
     
-def _create_auth_response(user: models.User, response: Response) -> dict:
+def _create_auth_response(user: Union[models.User, AuthUser], response: Response) -> dict:
     token_data = {"sub": user.email, "user_id": user.id}
     access_token = token_manager.create_access_token(token_data)
     refresh_token = token_manager.create_refresh_token(token_data)
@@ -65,6 +72,7 @@ def clear_auth_cookies(response: Response):
     response.delete_cookie("refresh_token", path="/api/v1/refresh", **cookie_settings)
 
 @router.post('/login/access-token', response_model=schemas.token.Token)
+@limiter.limit("5/minute")
 def login_access_token(
     request: Request,
     response: Response,
@@ -75,9 +83,6 @@ def login_access_token(
         Authenticate user and return access token.
     """
     
-    if hasattr(request.app.state, 'limiter'):
-        request.app.state.limiter.limit("5/minute")(request)
-    
     client_ip = request.client.host
     email = security_validator.sanitize_email(form_data.username)
     identifier = f"{email}:{client_ip}"
@@ -95,7 +100,9 @@ def login_access_token(
     
     # Authenticate user
     user = UserCRUD.get_user_by_email(db, email=email)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    hashed_password = user.hashed_password if user else DUMMY_PASSWORD_HASH
+    password_valid = verify_password(form_data.password, hashed_password)
+    if not user or not password_valid:
         _handle_failed_login(identifier)
     
     # Clear failed attempts on successful login
@@ -126,7 +133,7 @@ def refresh_access_token(
         )
     
     email = payload.get("sub")
-    user = UserCRUD.get_user_by_email(db, email=email)
+    user = UserCRUD.get_auth_projection(db, email=email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -140,7 +147,7 @@ def refresh_access_token(
 def logout(
     request: Request,
     response: Response,
-    current_user: models.User = Depends(dependencies.get_current_user)
+    current_user: AuthUser = Depends(dependencies.get_current_identity)
 ):
     token = dependencies.extract_token_from_request(request)
     if token:
@@ -151,8 +158,8 @@ def logout(
     return {"message": "Successfully logged out"}
 
 @router.get("/verify")
-def verfify_token(
-    current_user: models.User = Depends(dependencies.get_current_user)
+async def verfify_token(
+    current_user: AuthUser = Depends(dependencies.get_current_identity)
 ):
     return {
         "valid": True,
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 
 from ....database import models
 from ....database.repositories import profile
+from ....database.repositories.user import AuthUser
 from .. import schemas 
 from ... import dependencies
 
@@ -98,7 +99,7 @@ def read_profile_flags(
 @router.get('/users/me/skills', response_model=list[str])
 def read_user_skills(
     db: Session = Depends(dependencies.get_db),
-    current_user: models.User = Depends(dependencies.get_current_user),
+    current_user: AuthUser = Depends(dependencies.get_current_identity),
 ):
     rows = db.query(models.UserSkill).filter(models.UserSkill.user_id == current_user.id).all()
     return [r.name for r in rows]
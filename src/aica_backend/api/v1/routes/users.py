@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session
 
 from ....core.security import security_validator, verify_password
+from ....core.rate_limiter import limiter
 from ....database.repositories.user import UserCRUD
 from ....database.repositories import profile
 from ....database import models
@@ -12,15 +13,13 @@ from ..routes.auth import _create_auth_response
 router = APIRouter()
 
 @router.post('/', response_model=schemas.users.UserResponse)
+@limiter.limit("5/minute")
 def create_user(
     user_data: schemas.users.UserCreate,
     request: Request,
     response: Response,
     db: Session = Depends(dependencies.get_db),
 ):
-    if hasattr(request.app.state, 'limiter'):
-        request.app.state.limiter.limit("5/minute")(request)
-        
     try:
         # Check if user already exists
         existing_user = UserCRUD.get_user_by_email(db, email=user_data.email)
@@ -73,7 +72,7 @@ def create_user(
         )
     
 @router.get('/me', response_model=schemas.users.UserResponse)
-def get_current_user_info(
+async def get_current_user_info(
     current_user: models.User = Depends(dependencies.get_current_user)
 ):
     return {
@@ -13,6 +13,9 @@ class Settings(BaseSettings):
     POSTGRES_SERVER: str
     POSTGRES_DB: str
     POSTGRES_PORT: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE_SECONDS: int = 1800
     
     # Authentication & Security
     SECRET_KEY: str
@@ -21,6 +24,8 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     MAX_LOGIN_ATTEMPTS: int = 5
     LOCKOUT_DURATION_MINUTES: int = 15
+    TOKEN_CACHE_SIZE: int = 1024  # Verified tokens kept in memory
+    TOKEN_CACHE_TTL_SECONDS: int = 60
     
     # Password Security
     PASSWORD_HASH_ROUNDS: int = 12
@@ -39,8 +44,13 @@ class Settings(BaseSettings):
     # Embedding Settings
     EMBEDDING_MODEL_NAME: str = "sentence-transformers/all-MiniLM-L6-v2"
     EMBEDDING_DIMENSION: int = 384
+    EMBEDDING_BACKEND: str = "torch"  # Options: torch, onnx, openvino
+    EMBEDDING_MODEL_FILE: str = ""  # e.g. onnx/model_qint8_avx512_vnni.onnx for int8 ONNX inference
     VECTOR_SIMILARITY_THRESHOLD: float = 0.75
     VECTOR_BACKEND: str = "pgvector"  # Options: pgvector, faiss
+    EMBEDDING_CACHE_SIZE: int = 256  # Distinct skill lists kept in memory
+    VECTOR_IVFFLAT_PROBES: int = 10  # IVFFlat lists scanned per query (recall vs. latency)
+    VECTOR_CANDIDATE_MULTIPLIER: int = 5  # Nearest skill matches fetched per result before re-ranking
     
     # Scraping Configuration (ADDED MISSING FIELDS)
     SCRAPING_ENABLED: bool = True
@@ -1,26 +1,30 @@
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+from slowapi import Limiter
+from slowapi.util import get_remote_address
 from .config import settings
 
 
 class RateLimiter:
     def __init__(self):
-        self._failed_attempts: Dict[str, List[datetime]] = {}
-        self._lockout_duration = timedelta(minutes=settings.LOCKOUT_DURATION_MINUTES)
+        # Sliding window of monotonic attempt timestamps, oldest first
+        self._failed_attempts: Dict[str, Deque[float]] = {}
+        self._lockout_duration = settings.LOCKOUT_DURATION_MINUTES * 60
         self._max_attempts = settings.MAX_LOGIN_ATTEMPTS
     
     def check_rate_limit(self, identifier: str) -> bool:
-        now = datetime.utcnow()
+        now = time.monotonic()
         self._cleanup_old_attempts(identifier, now)
         
-        attempts = self._failed_attempts.get(identifier, [])
+        attempts = self._failed_attempts.get(identifier, ())
         return len(attempts) < self._max_attempts
     
     def record_failed_attempt(self, identifier: str) -> None:
-        now = datetime.utcnow()
+        now = time.monotonic()
         
         if identifier not in self._failed_attempts:
-            self._failed_attempts[identifier] = []
+            self._failed_attempts[identifier] = deque()
         
         self._failed_attempts[identifier].append(now)
     
@@ -32,26 +36,29 @@ class RateLimiter:
     def get_lockout_time_remaining(self, identifier: str) -> Optional[int]:
         """Get remaining lockout time in seconds."""
         if not self.check_rate_limit(identifier):
-            attempts = self._failed_attempts.get(identifier, [])
+            attempts = self._failed_attempts.get(identifier)
             if attempts:
                 oldest_relevant_attempt = attempts[0]
                 unlock_time = oldest_relevant_attempt + self._lockout_duration
-                remaining = (unlock_time - datetime.utcnow()).total_seconds()
+                remaining = unlock_time - time.monotonic()
                 return max(0, int(remaining))
         
         return None
     
-    def _cleanup_old_attempts(self, identifier: str, current_time: datetime) -> None:
+    def _cleanup_old_attempts(self, identifier: str, current_time: float) -> None:
         """Remove attempts older than lockout duration."""
-        if identifier in self._failed_attempts:
+        attempts = self._failed_attempts.get(identifier)
+        if attempts is not None:
+            # Attempts are appended in order, so expired ones sit at the front
             cutoff_time = current_time - self._lockout_duration
-            self._failed_attempts[identifier] = [
-                attempt for attempt in self._failed_attempts[identifier]
-                if attempt > cutoff_time
-            ]
+            while attempts and attempts[0] <= cutoff_time:
+                attempts.popleft()
 
-            if not self._failed_attempts[identifier]:
+            if not attempts:
                 del self._failed_attempts[identifier]
 
 
 rate_limiter = RateLimiter()
+
+# Per-client request limits on the public auth endpoints, registered on app.state
+limiter = Limiter(key_func=get_remote_address)
@@ -1,10 +1,15 @@
 import secrets
 import re
+import hashlib
 import logging
+import threading
+import time
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any, Tuple
-from jose import jwt, JWTError
+from cachetools import TTLCache
+import jwt
 from passlib.context import CryptContext
 from .config import settings
 
@@ -12,6 +17,18 @@ logger = logging.getLogger(__name__)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
 
+# Validation patterns, compiled once at import
+UPPERCASE_PATTERN = re.compile(r"[A-Z]")
+LOWERCASE_PATTERN = re.compile(r"[a-z]")
+DIGIT_PATTERN = re.compile(r"\d")
+SPECIAL_CHAR_PATTERN = re.compile(r"[!@#$%^&*(),.?\":{}|<>]")
+EMAIL_UNSAFE_CHARS_PATTERN = re.compile(r'[<>"\']')
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Shared JWT decode arguments, built once instead of per call
+DECODE_ALGORITHMS = [settings.ALGORITHM]
+DECODE_OPTIONS = {"require": ["exp", "sub"]}
+
 class SecurityValidator:
     """Handles password and email validation with security best practices."""
 
@@ -24,16 +41,16 @@ class SecurityValidator:
         if len(password) > settings.MAX_PASSWORD_LENGTH:
             return False, f"Password must be less than {settings.MAX_PASSWORD_LENGTH} characters"
         
-        if not re.search(r"[A-Z]", password):
+        if not UPPERCASE_PATTERN.search(password):
             return False, "Password must contain at least one uppercase letter"
         
-        if not re.search(r"[a-z]", password):
+        if not LOWERCASE_PATTERN.search(password):
             return False, "Password must contain at least one lowercase letter"
         
-        if not re.search(r"\d", password):
+        if not DIGIT_PATTERN.search(password):
             return False, "Password must contain at least one number"
         
-        if settings.REQUIRE_SPECIAL_CHARS and not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+        if settings.REQUIRE_SPECIAL_CHARS and not SPECIAL_CHAR_PATTERN.search(password):
             return False, "Password must contain at least one special character"
         
         return True, "Password meets security requirements"
@@ -45,13 +62,13 @@ class SecurityValidator:
             return ""
         
         email = email.strip().lower()
-        return re.sub(r'[<>"\']', '', email)
+        return EMAIL_UNSAFE_CHARS_PATTERN.sub('', email)
     
     @staticmethod
+    @lru_cache(maxsize=10_000)
     def validate_email_format(email: str) -> bool:
-        """Validate email format using regex."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, email))
+        """Validate email format using regex, memoized across requests."""
+        return bool(EMAIL_PATTERN.match(email))
 
 
 class TokenManager:
@@ -59,6 +76,9 @@ class TokenManager:
 
     def __init__(self):
         self.blacklisted_tokens = set()
+        # Decoded payloads of recently verified tokens, keyed by SHA-256 of the raw JWT
+        self._verified_tokens = TTLCache(maxsize=settings.TOKEN_CACHE_SIZE, ttl=settings.TOKEN_CACHE_TTL_SECONDS)
+        self._verified_tokens_lock = threading.Lock()
     
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create a new access token."""
@@ -93,14 +113,28 @@ class TokenManager:
     def verify_token(self, token: str, token_type: str = "access") -> Optional[Dict[str, Any]]:
         """Verify and decode a JWT token."""
         try:
-            logger.info(f"Verifying token of type: {token_type}")
+            logger.info("Verifying token of type: %s", token_type)
             
-            if self.is_token_blacklisted(token):
-                logger.warning("Token is blacklisted")
-                return None
+            cache_key = hashlib.sha256(token.encode()).digest()
+            with self._verified_tokens_lock:
+                payload = self._verified_tokens.get(cache_key)
             
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            logger.info(f"Token decoded successfully. Payload type: {payload.get('type')}")
+            if payload is not None:
+                # Cached entries can outlive a logout or the token's own expiry
+                if self._is_revoked(token, payload) or payload.get("exp", 0) <= time.time():
+                    logger.warning("Cached token is no longer valid")
+                    return None
+            else:
+                # Decode once and check the blacklist against that payload
+                payload = jwt.decode(token, settings.SECRET_KEY, algorithms=DECODE_ALGORITHMS, options=DECODE_OPTIONS)
+                logger.info("Token decoded successfully. Payload type: %s", payload.get('type'))
+                
+                if self._is_revoked(token, payload):
+                    logger.warning("Token is blacklisted")
+                    return None
+                
+                with self._verified_tokens_lock:
+                    self._verified_tokens[cache_key] = payload
             
             if payload.get("type") != token_type:
                 logger.warning(f"Token type mismatch. Expected: {token_type}, Got: {payload.get('type')}")
@@ -111,7 +145,7 @@ class TokenManager:
         except jwt.ExpiredSignatureError as e:
             logger.warning(f"Token expired: {str(e)}")
             return None
-        except JWTError as e:
+        except jwt.PyJWTError as e:
             logger.error(f"JWT Error: {str(e)}")
             return None
         except Exception as e:
@@ -121,26 +155,31 @@ class TokenManager:
     def blacklist_token(self, token: str) -> None:
         """Add token to blacklist."""
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=DECODE_ALGORITHMS, options=DECODE_OPTIONS)
             jti = payload.get("jti")
             if jti:
                 self.blacklisted_tokens.add(jti)
             else:
                 self.blacklisted_tokens.add(token)
-        except JWTError:
+        except jwt.PyJWTError:
             self.blacklisted_tokens.add(token)
     
+    def _is_revoked(self, token: str, payload: Dict[str, Any]) -> bool:
+        """Check a decoded token against the blacklist without decoding it again."""
+        jti = payload.get("jti")
+        return token in self.blacklisted_tokens or (jti is not None and jti in self.blacklisted_tokens)
+    
     def is_token_blacklisted(self, token: str) -> bool:
         """Check if token is blacklisted."""
         try:
             if token in self.blacklisted_tokens:
                 return True
             
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=DECODE_ALGORITHMS, options=DECODE_OPTIONS)
             jti = payload.get("jti")
             return jti in self.blacklisted_tokens if jti else False
                 
-        except JWTError:
+        except jwt.PyJWTError:
             return True
 
 
@@ -1,6 +1,6 @@
 import datetime
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import Boolean, String, DateTime, Date, Text, JSON, Integer, Float
 from sqlalchemy.orm import Mapped, mapped_column
 from ..base_class import Base
@@ -53,9 +53,10 @@ class JobPosting(Base):
     posting_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime, nullable=True)
     application_deadline: Mapped[Optional[datetime.date]] = mapped_column(Date, nullable=True)
     
-    # AI/ML fields
-    skills_embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(settings.EMBEDDING_DIMENSION), nullable=True)
-    description_embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(settings.EMBEDDING_DIMENSION), nullable=True)
+    # AI/ML fields (stored as halfvec to halve row and index size; deferred since
+    # similarity search runs in SQL and ORM reads never need the raw vectors)
+    skills_embedding: Mapped[Optional[List[float]]] = mapped_column(HALFVEC(settings.EMBEDDING_DIMENSION), nullable=True, deferred=True)
+    description_embedding: Mapped[Optional[List[float]]] = mapped_column(HALFVEC(settings.EMBEDDING_DIMENSION), nullable=True, deferred=True)
     
     extraction_quality_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
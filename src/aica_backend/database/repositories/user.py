@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from typing import Optional
@@ -7,6 +9,13 @@ from ...api.v1.schemas import users as user_schemas
 from ...core.security import get_password_hash, security_validator
 
 
+@dataclass(frozen=True, slots=True)
+class AuthUser:
+    """Identity columns only, for callers that never touch the full ORM row."""
+    id: int
+    email: str
+
+
 class UserCRUD:
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
@@ -21,6 +30,22 @@ class UserCRUD:
         except Exception:
             return None
     
+    @staticmethod
+    def get_auth_projection(db: Session, email: str) -> Optional[AuthUser]:
+        try:
+            sanitized_email = security_validator.sanitize_email(email)
+            
+            if not sanitized_email or not security_validator.validate_email_format(sanitized_email):
+                return None
+            
+            row = db.execute(
+                select(models.User.id, models.User.email).where(models.User.email == sanitized_email)
+            ).first()
+            return AuthUser(id=row.id, email=row.email) if row else None
+            
+        except Exception:
+            return None
+    
     @staticmethod
     def get_user_by_id(db: Session, user_id: int) -> Optional[models.User]:
         try:
@@ -4,6 +4,7 @@ import asyncio
 import threading
 
 from typing import List
+from functools import lru_cache
 from sentence_transformers import SentenceTransformer
 from concurrent.futures import ThreadPoolExecutor
 
@@ -19,14 +20,24 @@ class EmbeddingService:
         self._model = None
         self._executor = ThreadPoolExecutor(max_workers=2)
         self._lock = threading.Lock()
+        # Skill lists repeat across requests (profile views, matching, analysis), so keep their vectors
+        self._encode_skills_text = lru_cache(maxsize=settings.EMBEDDING_CACHE_SIZE)(self._encode_skills_text_uncached)
     
     @property
     def model(self) -> SentenceTransformer:
         if self._model is None:
             with self._lock:
                 if self._model is None:
-                    logger.info(f"Loading embedding model: {self.model_name}")
-                    self._model = SentenceTransformer(self.model_name)
+                    logger.info(f"Loading embedding model: {self.model_name} ({settings.EMBEDDING_BACKEND})")
+                    model_kwargs = {'file_name': settings.EMBEDDING_MODEL_FILE} if settings.EMBEDDING_MODEL_FILE else None
+                    # truncate_dim keeps vectors at EMBEDDING_DIMENSION, so Matryoshka-trained models
+                    # can be stored at a reduced size (no-op when it matches the model's own dimension)
+                    self._model = SentenceTransformer(
+                        self.model_name,
+                        backend=settings.EMBEDDING_BACKEND,
+                        model_kwargs=model_kwargs,
+                        truncate_dim=self.dimension
+                    )
                     logger.info("Embedding model loaded successfully.")
         return self._model
     
@@ -57,14 +68,23 @@ class EmbeddingService:
         try:
             cleaned_texts = [self._preprocess_text(text) for text in texts]
             
-            embeddings = self.model.encode(
-                cleaned_texts,
-                convert_to_numpy=True,
-                normalize_embeddings=True,
-                batch_size=32,
-            )
+            # Scraped batches often repeat the same posting; encode each distinct text once
+            unique_texts = [text for text in dict.fromkeys(cleaned_texts) if text]
+            
+            # Blank inputs map to a zero vector, matching encode_text
+            embeddings_by_text = {'': np.zeros(self.dimension)}
+            if unique_texts:
+                embeddings = self.model.encode(
+                    unique_texts,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    batch_size=32,
+                )
+                embeddings_by_text.update(
+                    (text, emb.astype(np.float32)) for text, emb in zip(unique_texts, embeddings)
+                )
             
-            return [emb.astype(np.float32) for emb in embeddings]
+            return [embeddings_by_text[text] for text in cleaned_texts]
         except Exception as e:
             logger.error(f"Error encoding texts: {e}")
             return [np.zeros(self.dimension) for _ in texts]
@@ -82,29 +102,45 @@ class EmbeddingService:
             return np.zeros(self.dimension)
         
         skills_text = self._format_skills_for_embedding(skills)
-        return self.encode_text(skills_text)
+        try:
+            return self._encode_skills_text(skills_text)
+        except Exception as e:
+            logger.error(f"Error encoding skills: {e}")
+            return np.zeros(self.dimension)
+    
+    def _encode_skills_text_uncached(self, skills_text: str) -> np.ndarray:
+        embedding = self.model.encode(
+            self._preprocess_text(skills_text),
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        ).astype(np.float32)
+        
+        # Cached vectors are shared between callers
+        embedding.flags.writeable = False
+        return embedding
     
     def encode_job_description(self, title: str, description: str,
                                required_skills: List[str] = None,
                                preferred_skills: List[str] = None
                                ) -> dict:
         
-        embeddings = {}
-        
-        embeddings['title'] = self.encode_text(title)
-        embeddings['description'] = self.encode_text(description)
-        
         all_skills = []
         if required_skills:
             all_skills.extend(required_skills)
         if preferred_skills:
             all_skills.extend(preferred_skills)
-            
-        if all_skills:
-            embeddings['skills'] = self.encode_skills(all_skills)
-        else:
-            embeddings['skills'] = np.zeros(self.dimension)
-            
+        
+        skills_text = self._format_skills_for_embedding(all_skills) if all_skills else ''
+        
+        # Title, description and skills share a single forward pass
+        title_emb, description_emb, skills_emb = self.encode_texts([title, description, skills_text])
+        
+        embeddings = {
+            'title': title_emb,
+            'description': description_emb,
+            'skills': skills_emb,
+        }
+        
         embeddings['combined'] = self._create_combined_embedding(
             embeddings['title'],
             embeddings['description'],
@@ -132,11 +168,26 @@ class EmbeddingService:
                 np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
             )
             
-            return max(0.0, min(1.0, similarity))
+            return float(max(0.0, min(1.0, similarity)))
         except Exception as e:
             logger.error(f"Error calculating similarity: {e}")
             return 0.0
     
+    def calculate_similarities(self, query_embedding: np.ndarray,
+                               candidate_embeddings: List[np.ndarray]) -> np.ndarray:
+        """
+            Calculate cosine similarity of the query against every candidate.
+            Expects unit-norm (or all-zero) vectors as returned by encode_*.
+            Returns an array of scores (0-1) in candidate order.
+        """
+        
+        # encode_* returns L2-normalized (or all-zero) vectors, so cosine similarity is
+        # a plain inner product and zero vectors score 0 without a separate check
+        query = np.asarray(query_embedding, dtype=np.float32)
+        candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+        
+        return np.clip(candidates @ query, 0.0, 1.0)
+    
     def find_most_similar(self, query_embedding: np.ndarray,
                           candidate_embeddings: List[np.ndarray],
                           top_k: int = 10) -> List[tuple]:
@@ -149,12 +200,16 @@ class EmbeddingService:
         if not candidate_embeddings:
             return []
         
-        similarities = []
-        for i, candidate in enumerate(candidate_embeddings):
-            similarity = self.calculate_similarity(query_embedding, candidate)
-            similarities.append((i, similarity))
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        # Callers may pass arbitrary vectors, so normalize rather than assume unit norm
+        query = np.asarray(query_embedding, dtype=np.float32)
+        candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+        norms = np.linalg.norm(candidates, axis=1) * np.linalg.norm(query)
+        dots = candidates @ query
+        similarities = np.clip(
+            np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0), 0.0, 1.0
+        )
+        top_indices = np.argsort(-similarities, kind='stable')[:top_k]
+        return [(int(i), float(similarities[i])) for i in top_indices]
     
     def _preprocess_text(self, text: str) -> str:
         if not text:
@@ -176,7 +231,8 @@ class EmbeddingService:
             Format skills list for optimal embedding generation.
         """
         
-        cleaned_skills = list(set(skill.strip() for skill in skills if skill.strip()))
+        # Sorted so the same skill set always yields the same text (and embedding cache key)
+        cleaned_skills = sorted({skill.strip() for skill in skills if skill.strip()})
         
         if len(cleaned_skills) == 1:
             return f"Skill: {cleaned_skills[0]}"
@@ -210,8 +266,10 @@ class EmbeddingService:
     def get_embedding_stats(self) -> dict:
         return {
             'model_name': self.model_name,
+            'backend': settings.EMBEDDING_BACKEND,
             'dimension': self.dimension,
-            'model_loaded': self._model is not None
+            'model_loaded': self._model is not None,
+            'skills_cache': self._encode_skills_text.cache_info()._asdict()
         }
 
 embedding_service = EmbeddingService()
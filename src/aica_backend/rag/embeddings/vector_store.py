@@ -10,6 +10,88 @@ from ...core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Statements are built once at import instead of re-creating a TextClause per call
+CONNECTIVITY_CHECK_SQL = text("SELECT 1 as test")
+PGVECTOR_EXTENSION_SQL = text("SELECT * FROM pg_extension WHERE extname = 'vector'")
+
+STORE_JOB_EMBEDDINGS_SQL = text("""
+    UPDATE job_postings
+    SET skills_embedding = CAST(:skills_emb AS halfvec),
+        description_embedding = CAST(:desc_emb AS halfvec),
+        updated_at = NOW()
+    WHERE id = :job_id
+""")
+
+STORE_USER_PROFILE_EMBEDDING_SQL = text("""
+    UPDATE user_profiles
+    SET skills_embedding = CAST(:skills_emb AS vector),
+        updated_at = NOW()
+    WHERE user_id = :user_id
+""")
+
+# Shared by find_similar_jobs and find_similar_jobs_sync
+FIND_SIMILAR_JOBS_SQL = text("""
+    SELECT
+        scored.*,
+        0.7 * scored.skills_similarity + 0.3 * scored.description_similarity AS combined_similarity
+    FROM (
+        SELECT
+            jp.id,
+            jp.title,
+            jp.company_name,
+            jp.location,
+            jp.description,
+            jp.required_skills,
+            jp.preferred_skills,
+            jp.salary_range,
+            jp.job_type,
+            jp.experience_level,
+            jp.posted_date,
+            1 - (jp.skills_embedding <=> CAST(:user_embedding AS halfvec)) AS skills_similarity,
+            1 - (jp.description_embedding <=> CAST(:user_embedding AS halfvec)) AS description_similarity
+        FROM job_postings AS jp
+        WHERE
+            jp.skills_embedding IS NOT NULL
+            AND jp.is_active = true
+        -- Nearest-neighbour order on the raw distance lets the IVFFlat index
+        -- serve the candidates; the LIMIT also keeps the distances computed once
+        ORDER BY jp.skills_embedding <=> CAST(:user_embedding AS halfvec)
+        LIMIT :candidate_limit
+    ) AS scored
+    WHERE
+        scored.skills_similarity >= :threshold
+        OR scored.description_similarity >= :threshold
+    ORDER BY combined_similarity DESC
+    LIMIT :limit
+""")
+
+# One-off upgrade for databases created before the job embeddings became halfvec.
+# The old vector_cosine_ops indexes cannot serve halfvec columns, so they are
+# dropped before the type change and rebuilt by create_performance_indexes.
+JOB_EMBEDDING_COLUMN_TYPE_SQL = text("""
+    SELECT format_type(a.atttypid, a.atttypmod)
+    FROM pg_attribute AS a
+    WHERE a.attrelid = 'job_postings'::regclass
+        AND a.attname = 'skills_embedding'
+        AND NOT a.attisdropped
+""")
+
+DROP_VECTOR_JOB_INDEXES_SQL = (
+    text("DROP INDEX IF EXISTS idx_job_skills_embedding"),
+    text("DROP INDEX IF EXISTS idx_job_description_embedding"),
+)
+
+ALTER_JOB_EMBEDDINGS_TO_HALFVEC_SQL = text(f"""
+    ALTER TABLE job_postings
+        ALTER COLUMN skills_embedding TYPE halfvec({int(settings.EMBEDDING_DIMENSION)})
+            USING skills_embedding::halfvec({int(settings.EMBEDDING_DIMENSION)}),
+        ALTER COLUMN description_embedding TYPE halfvec({int(settings.EMBEDDING_DIMENSION)})
+            USING description_embedding::halfvec({int(settings.EMBEDDING_DIMENSION)})
+""")
+
+# Transaction-local, so pooled connections keep the server default afterwards
+SET_IVFFLAT_PROBES = text("SELECT set_config('ivfflat.probes', :probes, true)")
+
 class VectorStore:
     def __init__(self):
         self.dimension = settings.EMBEDDING_DIMENSION
@@ -56,13 +138,11 @@ class VectorStore:
         try:
             async with self._get_session() as session:
                 # Test basic connectivity
-                query = text("SELECT 1 as test")
-                result = await session.execute(query)
+                result = await session.execute(CONNECTIVITY_CHECK_SQL)
                 row = result.fetchone()
 
                 # Check pgvector extension
-                query = text("SELECT * FROM pg_extension WHERE extname = 'vector'")
-                result = await session.execute(query)
+                result = await session.execute(PGVECTOR_EXTENSION_SQL)
                 pgvector_installed = result.fetchone() is not None
 
                 return {
@@ -91,28 +171,25 @@ class VectorStore:
             Success/failure statistics
         """
         try:
-            success_count = 0
-            failure_count = 0
-
-            for job_data in job_embeddings:
-                job_id = job_data['job_id']
-                embeddings = job_data['embeddings']
-
-                success = await self.store_job_embeddings(session, job_id, embeddings)
-                if success:
-                    success_count += 1
-                else:
-                    failure_count += 1
+            if job_embeddings:
+                # One executemany round trip and a single commit for the whole batch
+                await session.execute(STORE_JOB_EMBEDDINGS_SQL, [
+                    self._job_embedding_params(job_data['job_id'], job_data['embeddings'])
+                    for job_data in job_embeddings
+                ])
+                await session.commit()
+                logger.info(f"Stored embeddings for {len(job_embeddings)} jobs")
 
             return {
                 "total_processed": len(job_embeddings),
-                "successful": success_count,
-                "failed": failure_count,
-                "success_rate": success_count / len(job_embeddings) if job_embeddings else 0
+                "successful": len(job_embeddings),
+                "failed": 0,
+                "success_rate": 1.0 if job_embeddings else 0
             }
 
         except Exception as e:
             logger.error(f"Error in batch job embedding storage: {e}")
+            await session.rollback()
             return {
                 "total_processed": len(job_embeddings),
                 "successful": 0,
@@ -120,6 +197,31 @@ class VectorStore:
                 "error": str(e)
             }
 
+    async def migrate_job_embeddings_to_halfvec(self, session: AsyncSession) -> bool:
+        """
+        Convert existing vector job embedding columns to halfvec and drop their old indexes.
+        Run create_performance_indexes afterwards to rebuild them with halfvec_cosine_ops.
+        """
+        try:
+            result = await session.execute(JOB_EMBEDDING_COLUMN_TYPE_SQL)
+            column_type = result.scalar()
+            if column_type is None or column_type.startswith("halfvec"):
+                logger.info("Job embeddings already use halfvec, nothing to migrate")
+                return True
+
+            for drop_sql in DROP_VECTOR_JOB_INDEXES_SQL:
+                await session.execute(drop_sql)
+            await session.execute(ALTER_JOB_EMBEDDINGS_TO_HALFVEC_SQL)
+
+            await session.commit()
+            logger.info(f"Migrated job embeddings from {column_type} to halfvec")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error migrating job embeddings to halfvec: {e}")
+            await session.rollback()
+            return False
+
     async def create_performance_indexes(self, session: AsyncSession) -> bool:
         """
         Create optimized indexes for vector similarity search performance.
@@ -129,12 +231,12 @@ class VectorStore:
             indexes = [
                 """
                 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_skills_embedding
-                ON job_postings USING ivfflat (skills_embedding vector_cosine_ops)
+                ON job_postings USING ivfflat (skills_embedding halfvec_cosine_ops)
                 WITH (lists = 100);
                 """,
                 """
                 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_description_embedding
-                ON job_postings USING ivfflat (description_embedding vector_cosine_ops)
+                ON job_postings USING ivfflat (description_embedding halfvec_cosine_ops)
                 WITH (lists = 100);
                 """,
                 """
@@ -163,20 +265,7 @@ class VectorStore:
     async def store_job_embeddings(self, session: AsyncSession,
                                    job_id: int, embeddings: Dict[str, np.ndarray]) -> bool:
         try:
-            skills_embedding = embeddings.get('skills', np.zeros(self.dimension)).tolist()
-            description_embedding = embeddings.get('description', np.zeros(self.dimension)).tolist()
-            query = text("""
-                            UPDATE job_postings
-                            SET skills_embedding = :skills_emb::vector,
-                                description_embedding = :desc_emb::vector,
-                                updated_at = NOW()
-                            WHERE id = :job_id
-                        """)
-            await session.execute(query, {
-                'job_id': job_id,
-                'skills_emb': skills_embedding,
-                'desc_emb': description_embedding,
-            })
+            await session.execute(STORE_JOB_EMBEDDINGS_SQL, self._job_embedding_params(job_id, embeddings))
             await session.commit()
             logger.info(f"Stored embeddings for job ID {job_id}")
             return True
@@ -189,13 +278,7 @@ class VectorStore:
                                            user_id: int, skills_embedding: np.ndarray) -> bool:
         try:
             skills_emb_list = skills_embedding.tolist()
-            query = text("""
-                            UPDATE user_profiles
-                            SET skills_embedding = :skills_emb::vector,
-                                updated_at = NOW()
-                            WHERE user_id = :user_id
-                        """)
-            await session.execute(query, {
+            await session.execute(STORE_USER_PROFILE_EMBEDDING_SQL, {
                 'user_id': user_id,
                 'skills_emb': skills_emb_list
             })
@@ -212,64 +295,10 @@ class VectorStore:
                                 limit: int = 20,
                                 similarity_threshold: Optional[float] = None) -> List[Dict[str, Any]]:
         try:
-            threshold = similarity_threshold or self.similarity_threshold
-            user_emb_list = user_skills_embedding.tolist()
-            query = text("""
-                            SELECT
-                                jp.id,
-                                jp.title,
-                                jp.company_name,
-                                jp.location,
-                                jp.description,
-                                jp.required_skills,
-                                jp.preferred_skills,
-                                jp.salary_range,
-                                jp.job_type,
-                                jp.experience_level,
-                                jp.posted_date,
-                                1 - (jp.skills_embedding <=> :user_embedding::vector) AS skills_similarity,
-                                1 - (jp.description_embedding <=> :user_embedding::vector) AS description_similarity,
-                                (
-                                    0.7 * (1 - (jp.skills_embedding <=> :user_embedding::vector)) +
-                                    0.3 * (1 - (jp.description_embedding <=> :user_embedding::vector))
-                                ) AS combined_similarity
-                            FROM job_postings AS jp
-                            WHERE
-                                jp.skills_embedding IS NOT NULL 
-                                AND jp.is_active = true 
-                                AND (
-                                    1 - (jp.skills_embedding <=> :user_embedding::vector) >= :threshold
-                                    OR 1 - (jp.description_embedding <=> :user_embedding::vector) >= :threshold
-                                )
-                            ORDER BY combined_similarity DESC
-                            LIMIT :limit
-                        """)
-            result = await session.execute(query, {
-                'user_embedding': user_emb_list,
-                'threshold': threshold,
-                'limit': limit
-            })
-            jobs = []
-            for row in result.fetchall():
-                job_data = {
-                    'id': row.id,
-                    'title': row.title,
-                    'company_name': row.company_name,
-                    'location': row.location,
-                    'description': row.description,
-                    'required_skills': row.required_skills or [],
-                    'preferred_skills': row.preferred_skills or [],
-                    'salary_range': row.salary_range,
-                    'job_type': row.job_type,
-                    'experience_level': row.experience_level,
-                    'posted_date': row.posted_date,
-                    'similarity_scores': {
-                        'skills_similarity': float(row.skills_similarity),
-                        'description_similarity': float(row.description_similarity),
-                        'combined_similarity': float(row.combined_similarity)
-                    }
-                }
-                jobs.append(job_data)
+            params = self._similar_jobs_params(user_skills_embedding, limit, similarity_threshold)
+            await session.execute(SET_IVFFLAT_PROBES, {'probes': str(settings.VECTOR_IVFFLAT_PROBES)})
+            result = await session.execute(FIND_SIMILAR_JOBS_SQL, params)
+            jobs = [self._row_to_job(row) for row in result]
             logger.info(f"Found {len(jobs)} similar jobs for user skills embedding")
             return jobs
         except Exception as e:
@@ -282,67 +311,50 @@ class VectorStore:
                                limit: int = 20,
                                similarity_threshold: Optional[float] = None) -> List[Dict[str, Any]]:
         try:
-            threshold = similarity_threshold or self.similarity_threshold
-            user_emb_list = user_skills_embedding.tolist()
-            query = text("""
-                            SELECT
-                                jp.id,
-                                jp.title,
-                                jp.company_name,
-                                jp.location,
-                                jp.description,
-                                jp.required_skills,
-                                jp.preferred_skills,
-                                jp.salary_range,
-                                jp.job_type,
-                                jp.experience_level,
-                                jp.posted_date,
-                                1 - (jp.skills_embedding <=> :user_embedding::vector) AS skills_similarity,
-                                1 - (jp.description_embedding <=> :user_embedding::vector) AS description_similarity,
-                                (
-                                    0.7 * (1 - (jp.skills_embedding <=> :user_embedding::vector)) +
-                                    0.3 * (1 - (jp.description_embedding <=> :user_embedding::vector))
-                                ) AS combined_similarity
-                            FROM job_postings AS jp
-                            WHERE
-                                jp.skills_embedding IS NOT NULL 
-                                AND jp.is_active = true 
-                                AND (
-                                    1 - (jp.skills_embedding <=> :user_embedding::vector) >= :threshold
-                                    OR 1 - (jp.description_embedding <=> :user_embedding::vector) >= :threshold
-                                )
-                            ORDER BY combined_similarity DESC
-                            LIMIT :limit
-                        """)
-            result = session.execute(query, {
-                'user_embedding': user_emb_list,
-                'threshold': threshold,
-                'limit': limit
-            })
-            jobs = []
-            for row in result.fetchall():
-                job_data = {
-                    'id': row.id,
-                    'title': row.title,
-                    'company_name': row.company_name,
-                    'location': row.location,
-                    'description': row.description,
-                    'required_skills': row.required_skills or [],
-                    'preferred_skills': row.preferred_skills or [],
-                    'salary_range': row.salary_range,
-                    'job_type': row.job_type,
-                    'experience_level': row.experience_level,
-                    'posted_date': row.posted_date,
-                    'similarity_scores': {
-                        'skills_similarity': float(row.skills_similarity),
-                        'description_similarity': float(row.description_similarity),
-                        'combined_similarity': float(row.combined_similarity)
-                    }
-                }
-                jobs.append(job_data)
+            params = self._similar_jobs_params(user_skills_embedding, limit, similarity_threshold)
+            session.execute(SET_IVFFLAT_PROBES, {'probes': str(settings.VECTOR_IVFFLAT_PROBES)})
+            result = session.execute(FIND_SIMILAR_JOBS_SQL, params)
+            jobs = [self._row_to_job(row) for row in result]
             return jobs
         except Exception as e:
             logger.error(f"Error finding similar jobs (sync): {e}")
             return []
 
+    def _job_embedding_params(self, job_id: int, embeddings: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        return {
+            'job_id': job_id,
+            'skills_emb': embeddings.get('skills', np.zeros(self.dimension)).tolist(),
+            'desc_emb': embeddings.get('description', np.zeros(self.dimension)).tolist(),
+        }
+
+    def _similar_jobs_params(self, user_skills_embedding: np.ndarray, limit: int,
+                             similarity_threshold: Optional[float]) -> Dict[str, Any]:
+        return {
+            'user_embedding': user_skills_embedding.tolist(),
+            'threshold': similarity_threshold or self.similarity_threshold,
+            'limit': limit,
+            'candidate_limit': limit * settings.VECTOR_CANDIDATE_MULTIPLIER
+        }
+
+    @staticmethod
+    def _row_to_job(row) -> Dict[str, Any]:
+        return {
+            'id': row.id,
+            'title': row.title,
+            'company_name': row.company_name,
+            'location': row.location,
+            'description': row.description,
+            'required_skills': row.required_skills or [],
+            'preferred_skills': row.preferred_skills or [],
+            'salary_range': row.salary_range,
+            'job_type': row.job_type,
+            'experience_level': row.experience_level,
+            'posted_date': row.posted_date,
+            'similarity_scores': {
+                'skills_similarity': float(row.skills_similarity),
+                'description_similarity': float(row.description_similarity),
+                'combined_similarity': float(row.combined_similarity)
+            }
+        }
+
 vector_store = VectorStore()
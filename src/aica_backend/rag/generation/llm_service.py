@@ -1,12 +1,12 @@
 import logging
 import httpx
 import asyncio
+import orjson
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from ...core.config import settings
 from .prompt_templates import prompt_templates
-from .prompt_templates import prompt_templates
 
 logger = logging.getLogger(__name__)
 
@@ -74,11 +74,11 @@ class LLMService:
                 }
                 response = await client.post(
                     f"{self.base_url}/api/generate",
-                    json=payload,
+                    content=orjson.dumps(payload),
                     headers={"Content-Type": "application/json"}
                 )
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     return result.get("response", "").strip()
                 else:
                     logger.error(f"Failed to generate completion: {response.status_code} - {response.text}")
@@ -1,5 +1,7 @@
 from typing import List, Dict, Any, Optional
+import asyncio
 import logging
+import time
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
@@ -15,9 +17,17 @@ from ..embeddings.embedding_service import embedding_service
 from ..embeddings.store_factory import get_vector_store
 from ..generation.llm_service import llm_service
 from ...core.config import settings
+from ...utils.common import clean_text
 
 logger = logging.getLogger(__name__)
 
+# Common technical skills for the fallback extractor, paired with their display form
+FALLBACK_TECH_SKILLS = tuple((skill, skill.title()) for skill in (
+    'python', 'java', 'javascript', 'react', 'node.js', 'django', 'flask',
+    'sql', 'postgresql', 'mongodb', 'machine learning', 'ai', 'nlp',
+    'docker', 'kubernetes', 'aws', 'git', 'linux', 'html', 'css'
+))
+
 class RAGPipeline:
     def __init__(self):
         self.embedding_service = embedding_service
@@ -25,16 +35,27 @@ class RAGPipeline:
         self.llm_service = llm_service
 
         # Initialize LangChain components
+        self._embeddings = None
+        self._embeddings_error: Optional[Exception] = None
         self._setup_langchain_components()
 
+    @property
+    def embeddings(self) -> Optional[HuggingFaceEmbeddings]:
+        """LangChain embeddings, loaded on first use rather than at import."""
+        # A failed load is remembered so later accesses fall back without retrying
+        if self._embeddings is None and self._embeddings_error is None:
+            try:
+                self._embeddings = HuggingFaceEmbeddings(
+                    model_name=settings.EMBEDDING_MODEL_NAME
+                )
+            except Exception as e:
+                self._embeddings_error = e
+                logger.error(f"Error loading LangChain embeddings: {e}")
+        return self._embeddings
+
     def _setup_langchain_components(self):
         """Setup LangChain components for RAG pipeline."""
         try:
-            # Initialize embeddings
-            self.embeddings = HuggingFaceEmbeddings(
-                model_name=settings.EMBEDDING_MODEL_NAME
-            )
-
             # Initialize LLM
             self.llm = OllamaLLM(
                 model=settings.OLLAMA_MODEL_NAME,
@@ -48,7 +69,6 @@ class RAGPipeline:
         except Exception as e:
             logger.error(f"Error setting up LangChain components: {e}")
             # Fallback to existing services
-            self.embeddings = None
             self.llm = None
 
     def _setup_prompts(self):
@@ -123,21 +143,9 @@ class RAGPipeline:
     async def _extract_skills_fallback(self, job_description: str) -> Dict[str, Any]:
         """Fallback skill extraction method."""
         # Simple pattern-based extraction
-        from ...utils.common import clean_text
-
         text = clean_text(job_description).lower()
 
-        # Common technical skills
-        tech_skills = []
-        tech_patterns = [
-            'python', 'java', 'javascript', 'react', 'node.js', 'django', 'flask',
-            'sql', 'postgresql', 'mongodb', 'machine learning', 'ai', 'nlp',
-            'docker', 'kubernetes', 'aws', 'git', 'linux', 'html', 'css'
-        ]
-
-        for skill in tech_patterns:
-            if skill in text:
-                tech_skills.append(skill.title())
+        tech_skills = [title for skill, title in FALLBACK_TECH_SKILLS if skill in text]
 
         return {
             "technical_skills": tech_skills,
@@ -152,8 +160,8 @@ class RAGPipeline:
                                 filters: Optional[Dict[str, Any]] = None,
                                 limit: int = 20,
                                 generate_explanation: bool = True) -> Dict[str, Any]:
+        start_time = time.perf_counter()
         try:
-            start_time = datetime.now()
             user_skills_embedding = self.embedding_service.encode_skills(user_skills)
             await self.vector_store.store_user_profile_embedding(session, user_id, user_skills_embedding)
             if filters:
@@ -166,16 +174,18 @@ class RAGPipeline:
                 )
             if not matched_jobs:
                 return {"matches": [], "total_matches": 0, "user_skills": user_skills,
-                        "processing_time": (datetime.now() - start_time).total_seconds(),
+                        "processing_time": time.perf_counter() - start_time,
                         "explanation_generated": False}
             explanations = {}
+            summary = None
             if generate_explanation:
-                explanations = await self._generate_match_explanation(user_skills, matched_jobs[:5])
+                # The summary does not depend on the per-job explanations, so request both at once
+                explanations, summary = await asyncio.gather(
+                    self._generate_match_explanation(user_skills, matched_jobs[:5]),
+                    self.llm_service.generate_multiple_job_matches_summary(user_skills, matched_jobs)
+                )
             enhanced_matches = self._enhance_matches_with_explanations(matched_jobs, explanations)
-            summary = None
-            if generate_explanation and matched_jobs:
-                summary = await self.llm_service.generate_multiple_job_matches_summary(user_skills, matched_jobs)
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             return {
                 "matches": enhanced_matches,
                 "total_matches": len(matched_jobs),
@@ -188,40 +198,43 @@ class RAGPipeline:
         except Exception as e:
             logger.error(f"Error in job matching pipeline: {str(e)}")
             return {"matches": [], "total_matches": 0, "user_skills": user_skills,
-                    "error": str(e), "processing_time": 0, "explanations_generated": False}
+                    "error": str(e), "processing_time": time.perf_counter() - start_time,
+                    "explanations_generated": False}
 
     async def _generate_match_explanation(self,
                                           user_skills: List[str],
                                           matched_jobs: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        job_ids = [job_data['id'] for job_data in matched_jobs]
+        # The LLM calls are independent, so run them concurrently instead of one after another
+        results = await asyncio.gather(
+            *(
+                self.llm_service.generate_job_match_explanation(
+                    user_skills,
+                    job_data,
+                    job_data.get('similarity_scores', {})
+                )
+                for job_data in matched_jobs
+            ),
+            return_exceptions=True
+        )
         explanations = {}
-        tasks = []
-        for job_data in matched_jobs:
-            task = self.llm_service.generate_job_match_explanation(
-                user_skills,
-                job_data,
-                job_data.get('similarity_scores', {})
-            )
-            tasks.append((job_data['id'], task))
-        for job_id, task in tasks:
-            try:
-                explanation = await task
-                explanations[job_id] = explanation
-            except Exception as e:
-                logger.error(f"Failed to generate explanation for job {job_id}: {str(e)}")
-                explanations[job_id] = {"error": str(e), "explanation": "Unable to generate explanation at this time", "fallback": True}
+        for job_id, result in zip(job_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to generate explanation for job {job_id}: {str(result)}")
+                explanations[job_id] = {"error": str(result), "explanation": "Unable to generate explanation at this time", "fallback": True}
+            else:
+                explanations[job_id] = result
         return explanations
 
     def _enhance_matches_with_explanations(self,
                                            matched_jobs: List[Dict[str, Any]],
                                            explanations: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
-        enhanced_matches = []
+        # The match dicts are built fresh by the vector store for this request, so annotate them in place
         for job_data in matched_jobs:
-            job_id = job_data.get('id')
-            enhanced_job = job_data.copy()
-            if job_id in explanations:
-                enhanced_job['ai_explanation'] = explanations[job_id]
-            enhanced_matches.append(enhanced_job)
-        return enhanced_matches
+            explanation = explanations.get(job_data.get('id'))
+            if explanation is not None:
+                job_data['ai_explanation'] = explanation
+        return matched_jobs
 
 rag_pipeline = RAGPipeline()
 
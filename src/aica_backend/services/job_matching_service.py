@@ -231,20 +231,23 @@ class JobMatchingService:
     ) -> Dict[str, float]:
         """Calculate detailed similarity scores between user and job."""
         try:
-            # Skill-based similarity
-            user_embedding = self.embedding_service.encode_skills(user_skills)
-            job_embedding = self.embedding_service.encode_skills(job_skills)
-            skill_similarity = self.embedding_service.calculate_similarity(
-                user_embedding, job_embedding
-            )
-
-            # Description-based similarity (if available)
-            desc_similarity = 0.0
-            if job_details.full_text:
-                desc_embedding = self.embedding_service.encode_text(job_details.full_text)
-                desc_similarity = self.embedding_service.calculate_similarity(
-                    user_embedding, desc_embedding
-                )
+            skill_similarity = desc_similarity = 0.0
+
+            # Without user skills every similarity is zero, so skip the job encodes
+            if user_skills:
+                # Skill-based similarity
+                user_embedding = self.embedding_service.encode_skills(user_skills)
+                candidates = [self.embedding_service.encode_skills(job_skills)]
+
+                # Description-based similarity (if available)
+                if job_details.full_text:
+                    candidates.append(self.embedding_service.encode_text(job_details.full_text))
+
+                # Score skills and description against the user in a single pass
+                similarities = self.embedding_service.calculate_similarities(user_embedding, candidates)
+                skill_similarity = similarities[0]
+                if job_details.full_text:
+                    desc_similarity = similarities[1]
 
             # Combined similarity score
             combined_similarity = 0.7 * skill_similarity + 0.3 * desc_similarity
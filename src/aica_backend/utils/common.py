@@ -3,7 +3,6 @@ Common utility functions used across the AICA backend.
 Consolidated from various utility modules to follow DRY principle.
 """
 
-import re
 from typing import Optional, List
 from datetime import datetime
 
@@ -20,7 +19,7 @@ def clean_text(text: Optional[str]) -> str:
     """
     if not text or not isinstance(text, str):
         return ''
-    return re.sub(r'\s+', ' ', text).strip()
+    return ' '.join(text.split())
 
 
 def parse_date_string(date_str: Optional[str]) -> Optional[datetime.date]:
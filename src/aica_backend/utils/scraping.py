@@ -1,10 +1,9 @@
-import re
 from typing import Optional, List
 
 def clean_text(text: Optional[str]) -> str:
     if not text or not isinstance(text, str):
         return ''
-    return re.sub(r'\s+', ' ', text).strip()
+    return ' '.join(text.split())
 
 def normalize_employment_type(employment_type: Optional[str]) -> str:
     if not employment_type: